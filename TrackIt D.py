@@ -386,6 +386,7 @@ class StudyTrackerApp:
         self.pages = {}
         self.init_pages()
         self.show_page("MainPage")
+        self.create_themes()
         self.apply_theme()
 
     def init_pages(self):
@@ -541,19 +542,27 @@ class StudyTrackerApp:
         else:
             messagebox.showerror("Error", "Please enter at least one subject")
 
+    def create_themes(self):
+        # Register both palettes once; toggling is then a single theme switch
+        self.style = ttk.Style()
+        for name, bg, fg in (("trackit_light", "#ffffff", "#000000"),
+                             ("trackit_dark", "#1e1e1e", "#ffffff")):
+            if name in self.style.theme_names():
+                continue
+            self.style.theme_create(name, parent='default', settings={
+                "TLabel": {"configure": {"background": bg, "foreground": fg}},
+                "TFrame": {"configure": {"background": bg}},
+                "TButton": {"configure": {"padding": 6}},
+                "Theme.TButton": {"configure": {"background": "#87ceeb"}},
+                "Primary.TButton": {"configure": {"background": "#4CAF50", "foreground": "white"}},
+                "Danger.TButton": {"configure": {"background": "#f44336", "foreground": "white"}},
+                "Accent.TButton": {"configure": {"background": "#2196F3", "foreground": "white"}},
+                "Graph.TButton": {"configure": {"background": "#9C27B0", "foreground": "white"}},
+            })
+
     def apply_theme(self):
         bg = "#1e1e1e" if self.is_dark else "#ffffff"
-        fg = "#ffffff" if self.is_dark else "#000000"
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure("TLabel", background=bg, foreground=fg)
-        style.configure("TFrame", background=bg)
-        style.configure("TButton", padding=6)
-        style.configure("Theme.TButton", background="#87ceeb")
-        style.configure("Primary.TButton", background="#4CAF50", foreground="white")
-        style.configure("Danger.TButton", background="#f44336", foreground="white")
-        style.configure("Accent.TButton", background="#2196F3", foreground="white")
-        style.configure("Graph.TButton", background="#9C27B0", foreground="white")
+        self.style.theme_use('trackit_dark' if self.is_dark else 'trackit_light')
         self.root.configure(bg=bg)
 
     def toggle_theme(self):